@@ -1,24 +1,73 @@
 # scrape_player.py
 # Usage:
 #   pip install httpx[http2] beautifulsoup4 lxml rapidfuzz tenacity python-slugify
+#   # optional faster HTML parsing for roster/stats pages:
+#   # pip install selectolax
+#   # optional faster JSON-LD parsing:
+#   # pip install orjson
+#   # optional faster event loop (not on Windows):
+#   # pip install "uvloop>=0.18"
 #   # optional search fallback:
 #   # pip install google-search-results  (and set SERPAPI_KEY)
 #   python scrape_player.py "Abdirasak Bulale" "St. Olaf College"
+#   # results are cached under ~/.cache/athletiq for a few hours; bypass with:
+#   python scrape_player.py "Abdirasak Bulale" "St. Olaf College" --refresh
+#   # add --debug to log fetch/parse diagnostics
 
-import asyncio, re, os, json, csv
+import asyncio, re, os, json, csv, time, hashlib, logging, weakref, codecs
 from typing import Optional, Dict, Any, List, Tuple
 import httpx
-from bs4 import BeautifulSoup
-from rapidfuzz import fuzz
+from bs4 import BeautifulSoup, NavigableString
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 from tenacity import retry, wait_exponential, stop_after_attempt
 from slugify import slugify
 
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Diagnostics go through logging (off by default, --debug on the CLI) rather than
+# print, so concurrent fetches don't contend on stdout.
+log = logging.getLogger("scrape_player")
+
 SPORT_PATH = "mens-soccer"
 DEFAULT_HEADERS = {
     "User-Agent": "RecruitScoutBot/0.2 (+contact: you@yourdomain.com)",
     "Accept-Language": "en-US,en;q=0.9",
 }
 TIMEOUT = httpx.Timeout(20.0)
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+CACHE_DIR = os.path.expanduser("~/.cache/athletiq")
+
+# One pooled client per event loop so repeat hits on an athletics domain reuse
+# keep-alive connections instead of redoing TCP+TLS for every lookup. The pool
+# is bound to the loop that built it, so a new loop (e.g. a second
+# asyncio.run) gets a fresh client.
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+async def get_client() -> httpx.AsyncClient:
+    global _CLIENT, _CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        _CLIENT = httpx.AsyncClient(timeout=TIMEOUT, headers=DEFAULT_HEADERS, http2=True, limits=LIMITS)
+        _CLIENT_LOOP = loop
+    return _CLIENT
+
+async def close_client() -> None:
+    """Close the shared client; call on shutdown from the event loop that used it."""
+    global _CLIENT, _CLIENT_LOOP
+    if _CLIENT is not None and _CLIENT_LOOP is asyncio.get_running_loop():
+        await _CLIENT.aclose()
+    _CLIENT = None
+    _CLIENT_LOOP = None
 
 # Load accolades data
 def load_accolades_data() -> Dict[str, List[Dict[str, str]]]:
@@ -38,7 +87,7 @@ def load_accolades_data() -> Dict[str, List[Dict[str, str]]]:
                     'year': row['Year']
                 })
     except FileNotFoundError:
-        print("DEBUG: all_region.csv file not found")
+        log.debug("all_region.csv file not found")
         accolades['all_region'] = []
     
     try:
@@ -54,7 +103,7 @@ def load_accolades_data() -> Dict[str, List[Dict[str, str]]]:
                     'year': row['Year']
                 })
     except FileNotFoundError:
-        print("DEBUG: all_american.csv file not found")
+        log.debug("all_american.csv file not found")
         accolades['all_american'] = []
     
     try:
@@ -70,7 +119,7 @@ def load_accolades_data() -> Dict[str, List[Dict[str, str]]]:
                     'year': row['Year']
                 })
     except FileNotFoundError:
-        print("DEBUG: all_miac.csv file not found")
+        log.debug("all_miac.csv file not found")
         accolades['all_miac'] = []
     
     return accolades
@@ -78,11 +127,12 @@ def load_accolades_data() -> Dict[str, List[Dict[str, str]]]:
 def find_player_accolades(player_name: str, school: str, accolades_data: Dict[str, List[Dict[str, str]]]) -> List[str]:
     """Find accolades for a given player."""
     found_accolades = []
+    player_name_lower = player_name.lower()
     
     # Search through all-region data
     for accolade in accolades_data.get('all_region', []):
         # Use fuzzy matching to find the player
-        name_match_score = fuzz.token_set_ratio(player_name.lower(), accolade['name'].lower())
+        name_match_score = fuzz.token_set_ratio(player_name_lower, accolade['name'].lower())
         
         if name_match_score >= 85:  # High confidence match
             # Format: "2024 Third Team All-Region IX"
@@ -95,7 +145,7 @@ def find_player_accolades(player_name: str, school: str, accolades_data: Dict[st
     # Search through all-american data
     for accolade in accolades_data.get('all_american', []):
         # Use fuzzy matching to find the player
-        name_match_score = fuzz.token_set_ratio(player_name.lower(), accolade['name'].lower())
+        name_match_score = fuzz.token_set_ratio(player_name_lower, accolade['name'].lower())
         
         if name_match_score >= 85:  # High confidence match
             # Format: "2024 First Team All-American"
@@ -107,7 +157,7 @@ def find_player_accolades(player_name: str, school: str, accolades_data: Dict[st
     # Search through all-miac data
     for accolade in accolades_data.get('all_miac', []):
         # Use fuzzy matching to find the player
-        name_match_score = fuzz.token_set_ratio(player_name.lower(), accolade['name'].lower())
+        name_match_score = fuzz.token_set_ratio(player_name_lower, accolade['name'].lower())
         
         if name_match_score >= 85:  # High confidence match
             # Format based on team type
@@ -128,8 +178,9 @@ def find_player_accolades(player_name: str, school: str, accolades_data: Dict[st
     
     return found_accolades
 
+# Keys are stored pre-normalized (see norm_key) so a lookup is a single dict hit.
 SCHOOL_TO_ATHLETICS = {
-    "st. olaf college": "athletics.stolaf.edu",
+    "st olaf college": "athletics.stolaf.edu",
     "saint olaf": "athletics.stolaf.edu",
     "st olaf": "athletics.stolaf.edu",
     "macalester college": "athletics.macalester.edu",
@@ -144,39 +195,50 @@ SCHOOL_TO_ATHLETICS = {
     "bethel": "athletics.bethel.edu",
     "hamline university": "hamlineathletics.com",
     "hamline": "hamlineathletics.com",
-    "saint john's university": "gojohnnies.com",
+    "saint johns university": "gojohnnies.com",
     "saint johns": "gojohnnies.com",
-    "st. john's": "gojohnnies.com",
     "st johns": "gojohnnies.com",
-    "saint mary's university of minnesota": "saintmaryssports.com",
+    "saint marys university of minnesota": "saintmaryssports.com",
     "saint marys": "saintmaryssports.com",
-    "st. mary's": "saintmaryssports.com",
     "st marys": "saintmaryssports.com",
-    "the college of st. scholastica": "csssaints.com",
-    "st. scholastica": "csssaints.com",
+    "the college of st scholastica": "csssaints.com",
     "st scholastica": "csssaints.com",
     "scholastica": "csssaints.com",
 }
 
 # ---------------- Utilities ----------------
 
+_WS_RE = re.compile(r"\s+")
+_NONALNUM_RE = re.compile(r"[^a-z0-9 ]")
+_SCHOOL_SUFFIX_RE = re.compile(r"\b(college|university)\b")
+# Tried in order: 5-11 / 5'11, then 5 ft 11 in, then a bare 6'
+_HEIGHT_RES = [
+    re.compile(r"(?P<f>\d)\s*[-'’]\s*(?P<i>\d{1,2})"),
+    re.compile(r"\b(?P<f>\d)\s*ft\.?\s*(?P<i>\d{1,2})?\s*in\.?\b", re.I),
+    re.compile(r"\b(?P<f>\d)\s*['’]\s*(?P<i>\d{1,2})?\b"),
+]
+
 def norm(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _WS_RE.sub(" ", s or "").strip()
 
 def norm_key(s: str) -> str:
-    return re.sub(r"[^a-z0-9 ]", "", (s or "").lower())
+    return norm(_NONALNUM_RE.sub("", (s or "").lower()))
 
 def feet_in_to_cm(text: str) -> Optional[int]:
-    m = re.search(r"(?P<f>\d)\s*[-'’]\s*(?P<i>\d{1,2})", text)
-    if not m:
-        m = re.search(r"\b(?P<f>\d)\s*ft\.?\s*(?P<i>\d{1,2})?\s*in\.?\b", text, re.I)
-    if not m:
-        m = re.search(r"\b(?P<f>\d)\s*['’]\s*(?P<i>\d{1,2})?\b", text)
-    if not m:
+    for pat in _HEIGHT_RES:
+        m = pat.search(text)
+        if m:
+            break
+    else:
         return None
     f = int(m.group("f")); i = int(m.group("i") or 0)
     return round((f * 12 + i) * 2.54)
 
+def canonical_url(url: str) -> str:
+    """Drop the fragment and any trailing slash so equivalent page URLs compare equal."""
+    x = httpx.URL(url)
+    return str(x.copy_with(path=x.path.rstrip("/") or "/", fragment=None))
+
 def absolutize(base: str, maybe: Optional[str]) -> Optional[str]:
     if not maybe:
         return None
@@ -185,23 +247,203 @@ def absolutize(base: str, maybe: Optional[str]) -> Optional[str]:
     except Exception:
         return maybe
 
-def best_match(target: str, options: List[str]) -> Optional[str]:
-    target_low = target.lower()
-    scored: List[Tuple[int,str]] = []
-    for opt in options:
-        if not opt: continue
-        scored.append((fuzz.token_set_ratio(target_low, opt.lower()), opt))
-    if not scored: return None
-    scored.sort(reverse=True, key=lambda x: x[0])
+# Roster and stats pages only need CSS selection + text, so they go through
+# selectolax when it is installed and fall back to BeautifulSoup otherwise.
+
+# Selectors used on every roster/stats/profile table scan
+_SPORTS_ANCHOR_SEL = 'a[href*="/sports/"]'
+_ROSTER_ANCHOR_SEL = 'a[href*="/sports/"][href*="/roster/"]'
+_TABLE_SEL = "table"
+_HDR_THEAD_SEL = "thead th"
+_HDR_ROW_SEL = "tr th"
+_ROW_SEL = "tbody tr"
+_CELL_SEL = "td"
+
+# Header sets for recognizing stats tables
+_PLAYER_COLS = frozenset({"#", "player", "name"})
+_SCORING_COLS = frozenset({"gp", "g", "a", "pts"})
+_COMMON_COLS = frozenset({"gp", "g", "a", "pts", "min", "gs", "sog", "gw", "sh", "yc", "rc"})
+_SEASONISH = frozenset({"season", "year"})
+
+def parse_html(html):
+    if HTMLParser is not None:
+        return HTMLParser(html)
+    return BeautifulSoup(html, "lxml")
+
+def _is_utf8_response(r: httpx.Response) -> bool:
+    charset = r.charset_encoding
+    try:
+        return charset is None or codecs.lookup(charset).name == "utf-8"
+    except LookupError:
+        return False
+
+def soup_of_response(r: httpx.Response) -> BeautifulSoup:
+    """BeautifulSoup of a response body, honouring the Content-Type charset."""
+    # Raw bytes only for UTF-8; lxml rejects some valid labels (e.g. "latin-1"),
+    # so any other charset is decoded by httpx first.
+    if _is_utf8_response(r):
+        return BeautifulSoup(r.content, "lxml", from_encoding=r.charset_encoding)
+    return BeautifulSoup(r.text, "lxml")
+
+def parse_response(r: httpx.Response):
+    """parse_html on a response body, honouring the Content-Type charset."""
+    if HTMLParser is None:
+        return soup_of_response(r)
+    # lexbor reads raw bytes as UTF-8, so let httpx decode any other charset
+    return HTMLParser(r.content if _is_utf8_response(r) else r.text)
+
+def css(node, selector: str) -> list:
+    return node.css(selector) if HTMLParser is not None else node.select(selector)
+
+def node_text(node) -> str:
+    return node.text(separator=" ") if HTMLParser is not None else node.get_text(" ")
+
+def node_attr(node, name: str) -> Optional[str]:
+    return node.attributes.get(name) if HTMLParser is not None else node.get(name)
+
+def name_parts_of(name: str) -> List[str]:
+    """Distinctive (3+ char) alphanumeric tokens of a name, for cheap pre-gating."""
+    return [p for p in default_process(name).split() if len(p) >= 3]
+
+def mentions_name(text_lc: str, name_parts: List[str]) -> bool:
+    # Simple substring check before paying for a fuzzy score
+    return not name_parts or any(p in text_lc for p in name_parts)
+
+def best_match(target: str, options: List[Optional[str]]) -> Optional[str]:
     # require a reasonable score to avoid “St. Olaf College Athletics”
-    return scored[0][1] if scored[0][0] >= 70 else None
+    hit = process.extractOne(target, [opt for opt in options if opt], scorer=fuzz.token_set_ratio,
+                             processor=str.lower, score_cutoff=70)
+    return hit[0] if hit else None
+
+# Roster/stats lookups fan out with asyncio.gather; cap in-flight requests per host to stay polite.
+# Semaphores bind to the loop that first waits on them, so keep one set per running loop.
+HOST_CONCURRENCY = 8
+_HOST_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+def host_semaphore(url: str) -> asyncio.Semaphore:
+    host = httpx.URL(url).host
+    per_loop = _HOST_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    sem = per_loop.get(host)
+    if sem is None:
+        sem = per_loop[host] = asyncio.Semaphore(HOST_CONCURRENCY)
+    return sem
 
 @retry(wait=wait_exponential(multiplier=1, min=1, max=8), stop=stop_after_attempt(3))
-async def fetch(client: httpx.AsyncClient, url: str) -> httpx.Response:
-    r = await client.get(url, headers=DEFAULT_HEADERS, follow_redirects=True)
+async def fetch(client: httpx.AsyncClient, url: str, extra_headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+    headers = {**DEFAULT_HEADERS, **extra_headers} if extra_headers else DEFAULT_HEADERS
+    async with host_semaphore(url):
+        r = await client.get(url, headers=headers, follow_redirects=True)
+    if r.status_code == 304 and extra_headers:
+        return r  # conditional request: caller still holds the body
     r.raise_for_status()
     return r
 
+# Roster and stats pages are shared by every player at a school, so keep them
+# briefly and a batch of lookups downloads each page once. Profile pages are
+# fetched directly and never cached. Once an entry goes stale it is
+# revalidated with its ETag/Last-Modified; pages carrying validators are also
+# saved under CACHE_DIR so a later run can revalidate instead of re-downloading.
+PAGE_TTL = 600.0
+PAGE_CACHE_SIZE = 512
+# url -> (expires, html, final_url, etag, last_modified)
+_PAGE_CACHE: Dict[str, Tuple[float, str, str, Optional[str], Optional[str]]] = {}
+_TREE_CACHE: Dict[str, Tuple[str, Any]] = {}
+
+def read_json(path: str) -> Optional[Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_json(path: str, data: Any) -> None:
+    # Best effort: the on-disk caches are an optimization, never an error source
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+def _page_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, "pages", hashlib.sha1(url.encode()).hexdigest() + ".json")
+
+def load_stored_page(url: str) -> Optional[Dict[str, Any]]:
+    return read_json(_page_path(url))
+
+def store_page(url: str, page: Dict[str, Any]) -> None:
+    write_json(_page_path(url), page)
+
+# url -> download in progress, shared by concurrent lookups of the same page
+# url -> [download in progress, number of callers waiting on it]
+_INFLIGHT: Dict[str, List[Any]] = {}
+
+async def get_html(client: httpx.AsyncClient, url: str) -> Tuple[str, str]:
+    """Return (html, final_url) for url, from the page cache when still fresh."""
+    hit = _PAGE_CACHE.get(url)
+    if hit and hit[0] > time.monotonic():
+        return hit[1], hit[2]
+    entry = _INFLIGHT.get(url)
+    if entry is None:
+        task = asyncio.ensure_future(_load_html(client, url))
+        entry = _INFLIGHT[url] = [task, 0]
+        task.add_done_callback(lambda t: _finish_inflight(url, t))
+    task = entry[0]
+    entry[1] += 1
+    try:
+        # shield: one caller giving up must not cancel the download for the others...
+        return await asyncio.shield(task)
+    finally:
+        entry[1] -= 1
+        # ...but once nobody is waiting (e.g. an early roster hit), stop the download
+        if entry[1] == 0 and not task.done():
+            task.cancel()
+
+def _finish_inflight(url: str, task: "asyncio.Future[Tuple[str, str]]") -> None:
+    entry = _INFLIGHT.get(url)
+    if entry is not None and entry[0] is task:
+        del _INFLIGHT[url]
+    if not task.cancelled():
+        task.exception()  # mark retrieved even if every waiter was cancelled
+
+async def _load_html(client: httpx.AsyncClient, url: str) -> Tuple[str, str]:
+    now = time.monotonic()
+    hit = _PAGE_CACHE.get(url)
+    if hit:
+        html, final_url, etag, last_modified = hit[1:]
+    else:
+        stored = load_stored_page(url) or {}
+        html, final_url = stored.get("html"), stored.get("url")
+        etag, last_modified = stored.get("etag"), stored.get("last_modified")
+
+    conditional = {}
+    if html is not None:
+        if etag: conditional["If-None-Match"] = etag
+        if last_modified: conditional["If-Modified-Since"] = last_modified
+    r = await fetch(client, url, conditional)
+    if r.status_code != 304:
+        html, final_url = r.text, str(r.url)
+        etag, last_modified = r.headers.get("etag"), r.headers.get("last-modified")
+        if etag or last_modified:
+            store_page(url, {"url": final_url, "etag": etag, "last_modified": last_modified, "html": html})
+
+    if url not in _PAGE_CACHE and len(_PAGE_CACHE) >= PAGE_CACHE_SIZE:
+        evicted = next(iter(_PAGE_CACHE))
+        del _PAGE_CACHE[evicted]
+        _TREE_CACHE.pop(evicted, None)
+        _ROSTER_INDEX.pop(evicted, None)
+    _PAGE_CACHE[url] = (now + PAGE_TTL, html, final_url, etag, last_modified)
+    return html, final_url
+
+async def get_tree(client: httpx.AsyncClient, url: str) -> Tuple[Any, str]:
+    """Like get_html, but returns the parsed page; each cached page is parsed once."""
+    html, final_url = await get_html(client, url)
+    cached = _TREE_CACHE.get(url)
+    if cached is None or cached[0] is not html:
+        cached = _TREE_CACHE[url] = (html, parse_html(html))
+    return cached[1], final_url
+
 # ---------------- Search fallback (optional) ----------------
 
 async def search_profile_by_web(name: str, athletics_domain: str, sport_hint: str = "men's soccer") -> Optional[str]:
@@ -214,12 +456,15 @@ async def search_profile_by_web(name: str, athletics_domain: str, sport_hint: st
     data = search.get_dict()
     results = data.get("organic_results") or []
 
+    name_lc = name.lower()
+    name_parts = name_parts_of(name)
+
     def score(url: str, title: str, snippet: str) -> int:
         s = 0
         if "/sports/" in url and "/roster/" in url: s += 4
         if SPORT_PATH in url: s += 3
-        txt = f"{title} {snippet}"
-        if fuzz.partial_ratio(name.lower(), txt.lower()) > 90: s += 3
+        txt = f"{title} {snippet}".lower()
+        if mentions_name(txt, name_parts) and fuzz.partial_ratio(name_lc, txt) > 90: s += 3
         return s
 
     ranked = sorted(((r["link"], score(r["link"], r.get("title",""), r.get("snippet",""))) for r in results),
@@ -228,18 +473,50 @@ async def search_profile_by_web(name: str, athletics_domain: str, sport_hint: st
 
 # ---------------- SIDEARM: find profile ----------------
 
-async def sidearm_find_profile(client: httpx.AsyncClient, domain: str, name: str) -> Optional[str]:
+# roster url -> (html the index was built from, {token prefix: [(processed text, href), ...]})
+_ROSTER_INDEX: Dict[str, Tuple[str, Dict[str, List[Tuple[str, str]]]]] = {}
+
+async def roster_anchors(client: httpx.AsyncClient, url: str) -> Tuple[Dict[str, List[Tuple[str, str]]], str]:
+    """Index a roster page's player links by the first two characters of each name token.
+
+    Built once per cached page, so looking up many players from the same roster
+    only scores the handful of links that share a prefix with each name.
+    """
+    html, final_url = await get_html(client, url)
+    cached = _ROSTER_INDEX.get(url)
+    if cached is None or cached[0] is not html:
+        index: Dict[str, List[Tuple[str, str]]] = {}
+        for a in css(parse_html(html), _ROSTER_ANCHOR_SEL):
+            text = default_process(node_text(a))
+            if not text: continue
+            entry = (text, node_attr(a, "href"))
+            for b in {tok[:2] for tok in text.split()}:
+                index.setdefault(b, []).append(entry)
+        cached = _ROSTER_INDEX[url] = (html, index)
+    return cached[1], final_url
+
+async def sidearm_find_profile(client: httpx.AsyncClient, domain: str, name: str) -> Tuple[Optional[str], bool]:
+    """Return (profile url or None, whether any roster page actually loaded).
+
+    The flag lets callers tell "not on the roster" apart from "site unreachable".
+    """
+    # name is fixed for every comparison below, so preprocess it once
+    name_lc = name.lower()
+    name_proc = default_process(name)
+    name_parts = name_parts_of(name)
+
     # 1) Site search
     qp = httpx.QueryParams({"query": name})
     search_url = f"https://{domain}/search?{qp}"
     try:
         r = await fetch(client, search_url)
-        soup = BeautifulSoup(r.text, "lxml")
-        for a in soup.select('a[href*="/sports/"]'):
-            href = a.get("href","")
+        tree = parse_response(r)
+        for a in css(tree, _SPORTS_ANCHOR_SEL):
+            href = node_attr(a, "href") or ""
             if "/roster/" in href and SPORT_PATH in href:
-                if fuzz.partial_ratio(name.lower(), a.get_text(" ").lower()) >= 90:
-                    return str(r.url.join(href))
+                text_lc = node_text(a).lower()
+                if mentions_name(text_lc, name_parts) and fuzz.partial_ratio(name_lc, text_lc) >= 90:
+                    return str(r.url.join(href)), True
     except Exception:
         pass
 
@@ -249,143 +526,163 @@ async def sidearm_find_profile(client: httpx.AsyncClient, domain: str, name: str
         f"https://{domain}/sports/{SPORT_PATH}/roster",
         f"https://{domain}/sports/{SPORT_PATH}/roster?view=2",
     ]
-    roster_urls = set()
+    # Ordered and keyed by canonical form so equivalent URLs are fetched once
+    roster_urls: Dict[str, None] = {}
     for base in patterns:
-        roster_urls.add(base)
         for yr in seasons:
+            url = httpx.URL(base)
             if yr:
-                roster_urls.add(base.rstrip("/") + f"/{yr}")
+                url = url.copy_with(path=url.path.rstrip("/") + f"/{yr}")
+            roster_urls.setdefault(canonical_url(str(url)))
 
-    for url in roster_urls:
-        try:
-            r = await fetch(client, url)
-        except Exception:
-            continue
-        soup = BeautifulSoup(r.text, "lxml")
-        candidates = []
-        for a in soup.select('a[href*="/sports/"][href*="/roster/"]'):
-            text = norm(a.get_text(" "))
-            if not text: continue
-            score = fuzz.token_set_ratio(name.lower(), text.lower())
-            if score >= 85:
-                candidates.append((score, str(r.url.join(a.get("href")))))
-        if candidates:
-            candidates.sort(reverse=True)
-            return candidates[0][1]
-    return None
+    buckets = {tok[:2] for tok in name_proc.split()}
+
+    async def match_roster(url: str) -> Optional[Tuple[float, str]]:
+        index, final_url = await roster_anchors(client, url)
+        # Only anchors sharing a name-token prefix with the query are candidates
+        entries = dict.fromkeys(entry for b in buckets for entry in index.get(b, ()))
+        hrefs, texts = [], []
+        for text, href in entries:
+            if not mentions_name(text, name_parts): continue
+            hrefs.append(href)
+            texts.append(text)
+        # Score every anchor in one rapidfuzz call rather than a Python loop
+        hit = process.extractOne(name_proc, texts, scorer=fuzz.token_set_ratio, processor=None, score_cutoff=85)
+        if not hit:
+            return None
+        return hit[1], str(httpx.URL(final_url).join(hrefs[hit[2]]))
+
+    # Scan roster pages as they arrive; a near-certain (>=95) match wins outright and
+    # cancels the rest, otherwise prefer the earliest roster URL with a match.
+    tasks = {asyncio.ensure_future(match_roster(url)): i for i, url in enumerate(roster_urls)}
+    pending = set(tasks)
+    matches: Dict[int, str] = {}
+    loaded = False
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    continue
+                loaded = True
+                if task.result() is None:
+                    continue
+                score, url = task.result()
+                if score >= 95:
+                    return url, True
+                matches[tasks[task]] = url
+    finally:
+        for task in pending:
+            task.cancel()
+    return (matches[min(matches)] if matches else None), loaded
 
 # ---------------- SIDEARM: fetch team stats for individual player ----------------
 
-async def fetch_player_stats_from_team_page(client: httpx.AsyncClient, domain: str, player_name: str, sport_path: str = SPORT_PATH) -> List[Dict[str, Any]]:
-    """Fetch individual player statistics from the team stats page for multiple seasons."""
+def find_player_rows_in_stats_page(tree, player_name: str) -> List[Dict[str, str]]:
+    """Return the matching player row from each individual-stats table on a team stats page."""
+    rows = []
+    player_name_lower = player_name.lower()
+    name_parts = player_name_lower.split()
+    for table in css(tree, _TABLE_SEL):
+        # Check if this table has the right headers for individual stats
+        headers = [norm(node_text(th)).lower() for th in css(table, _HDR_THEAD_SEL)]
+        if not headers:
+            headers = [norm(node_text(th)).lower() for th in css(table, _HDR_ROW_SEL)]
+
+        # Look for tables with individual player stats (should have jersey numbers and player names)
+        if _PLAYER_COLS.isdisjoint(headers) or _SCORING_COLS.isdisjoint(headers):
+            continue
+
+        table_rows, row_texts = [], []
+        for tr in css(table, _ROW_SEL):
+            tds = css(tr, _CELL_SEL)
+            if not tds or len(tds) < 3:
+                continue
+
+            cells = [norm(node_text(td)) for td in tds]
+            if len(cells) < len(headers):
+                continue
+            table_rows.append(cells)
+            row_texts.append(" ".join(cells).lower())
+
+        # Check which row contains our player: best fuzzy hit, else first row containing a name part
+        hit = process.extractOne(player_name_lower, row_texts, scorer=fuzz.partial_ratio, processor=None, score_cutoff=85)
+        if hit:
+            idx = hit[2]
+        else:
+            idx = next((i for i, row_text in enumerate(row_texts)
+                        if any(name_part in row_text for name_part in name_parts)), None)
+        if idx is not None:
+            cells = table_rows[idx]
+            rows.append(dict(zip(headers[:len(cells)], cells)))
+    return rows
+
+async def fetch_player_stats_from_team_page(client: httpx.AsyncClient, domain: str, player_name: str, sport_path: str = SPORT_PATH) -> Tuple[List[Dict[str, Any]], bool]:
+    """Fetch individual player statistics from the team stats page for multiple seasons.
+
+    Returns (rows, loaded); loaded is False when no stats page could be fetched at all,
+    so an outage isn't mistaken for a player without stats.
+    """
+    loaded = False
     try:
         # Try multiple seasons: 2024, 2023, 2022
         seasons = ["2024", "2023", "2022"]
         all_stats_rows = []
         
-        for season in seasons:
+        # Season pages are independent, so fetch them concurrently and process in season order
+        stats_urls = [f"https://{domain}/sports/{sport_path}/stats/{season}" for season in seasons]
+        log.debug("Trying seasons %s at %s", seasons, stats_urls)
+        responses = await asyncio.gather(*(get_tree(client, u) for u in stats_urls), return_exceptions=True)
+
+        for season, res in zip(seasons, responses):
+            if isinstance(res, BaseException):
+                log.debug("Error fetching season %s: %s", season, res)
+                continue
+            loaded = True
             try:
-                # Try season-specific URL
-                stats_url = f"https://{domain}/sports/{sport_path}/stats/{season}"
-                print(f"DEBUG: Trying season {season} at {stats_url}")
-                
-                r = await fetch(client, stats_url)
-                soup = BeautifulSoup(r.text, "lxml")
-                
-                # Look for individual offensive statistics table
-                for table in soup.select("table"):
-                    # Check if this table has the right headers for individual stats
-                    headers = [norm(th.get_text(" ")).lower() for th in table.select("thead th")]
-                    if not headers:
-                        headers = [norm(th.get_text(" ")).lower() for th in table.select("tr th")]
-                    
-                    # Look for tables with individual player stats (should have jersey numbers and player names)
-                    if any(h in ["#", "player", "name"] for h in headers) and any(h in ["gp", "g", "a", "pts"] for h in headers):
-                        for tr in table.select("tbody tr"):
-                            tds = tr.select("td")
-                            if not tds or len(tds) < 3:
-                                continue
-                            
-                            cells = [norm(td.get_text(" ")) for td in tds]
-                            if len(cells) < len(headers):
-                                continue
-                            
-                            # Check if this row contains our player
-                            row_text = " ".join(cells).lower()
-                            player_name_lower = player_name.lower()
-                            
-                            # Try to match player name in the row
-                            if (fuzz.partial_ratio(player_name_lower, row_text) >= 85 or 
-                                any(name_part in row_text for name_part in player_name_lower.split())):
-                                
-                                # Create a stats row with the available data
-                                row_data = dict(zip(headers[:len(cells)], cells))
-                                
-                                # Add season info
-                                row_data["_season"] = season
-                                row_data["_source"] = "team_stats_page"
-                                
-                                all_stats_rows.append(row_data)
-                                print(f"DEBUG: Found stats for {season}")
-                                break  # Found our player for this season
+                for row_data in find_player_rows_in_stats_page(res[0], player_name):
+                    # Add season info
+                    row_data["_season"] = season
+                    row_data["_source"] = "team_stats_page"
+                    all_stats_rows.append(row_data)
+                    log.debug("Found stats for %s", season)
                 
             except Exception as e:
-                print(f"DEBUG: Error fetching season {season}: {e}")
+                log.debug("Error parsing season %s: %s", season, e)
                 continue
         
         # If no season-specific data found, try the main stats page
         if not all_stats_rows:
-            print(f"DEBUG: No season-specific data found, trying main stats page...")
+            log.debug("No season-specific data found, trying main stats page...")
             stats_url = f"https://{domain}/sports/{sport_path}/stats"
-            r = await fetch(client, stats_url)
-            soup = BeautifulSoup(r.text, "lxml")
-            
-            for table in soup.select("table"):
-                headers = [norm(th.get_text(" ")).lower() for th in table.select("thead th")]
-                if not headers:
-                    headers = [norm(th.get_text(" ")).lower() for th in table.select("tr th")]
-                
-                if any(h in ["#", "player", "name"] for h in headers) and any(h in ["gp", "g", "a", "pts"] for h in headers):
-                    for tr in table.select("tbody tr"):
-                        tds = tr.select("td")
-                        if not tds or len(tds) < 3:
-                            continue
-                        
-                        cells = [norm(td.get_text(" ")) for td in tds]
-                        if len(cells) < len(headers):
-                            continue
-                        
-                        row_text = " ".join(cells).lower()
-                        player_name_lower = player_name.lower()
-                        
-                        if (fuzz.partial_ratio(player_name_lower, row_text) >= 85 or 
-                            any(name_part in row_text for name_part in player_name_lower.split())):
-                            
-                            row_data = dict(zip(headers[:len(cells)], cells))
-                            row_data["_season"] = "2024"  # Assume current season
-                            row_data["_source"] = "team_stats_page"
-                            
-                            all_stats_rows.append(row_data)
-                            print(f"DEBUG: Found stats from main page")
-                            break
+            tree, _ = await get_tree(client, stats_url)
+            loaded = True
+            for row_data in find_player_rows_in_stats_page(tree, player_name):
+                row_data["_season"] = "2024"  # Assume current season
+                row_data["_source"] = "team_stats_page"
+                all_stats_rows.append(row_data)
+                log.debug("Found stats from main page")
         
-        return all_stats_rows
+        return all_stats_rows, loaded
         
     except Exception as e:
-        print(f"Error fetching from team stats page: {e}")
-        return []
+        log.warning("Error fetching from team stats page: %s", e)
+        return [], loaded
 
-def guess_provider_from_html(html: str) -> Optional[str]:
+def guess_provider_from_html(html: bytes) -> Optional[str]:
+    # Lowercasing raw bytes skips the str decode and is cheaper than re.I scans
     low = html.lower()
-    if "sidearm" in low: return "sidearm"
-    if "prestosports" in low or "presto" in low: return "presto"
+    if b"sidearm" in low: return "sidearm"
+    if b"presto" in low: return "presto"  # also covers "prestosports"
     return None
 
 # ---------------- SIDEARM: parse profile ----------------
 
-def parse_sidearm_profile(html_text: str, page_url: str, input_name: str) -> Dict[str, Any]:
-    soup = BeautifulSoup(html_text, "lxml")
+# Bio labels whose following element holds the value ("Academic Year" is caught by "Year")
+_LABEL_RE = re.compile(r"\b(position|pos|class|year|hometown)\b", re.I)
+_PRIMARY_LABELS = frozenset({"position", "class", "hometown"})
 
+def parse_sidearm_profile(soup: BeautifulSoup, page_url: str, input_name: str) -> Dict[str, Any]:
     # --- Name: try many sources, then pick the one closest to input_name
     # First, try the specific Sidearm player name structure
     player_name_span = soup.select_one('.sidearm-roster-player-name')
@@ -414,7 +711,7 @@ def parse_sidearm_profile(html_text: str, page_url: str, input_name: str) -> Dic
         jsonld_names = []
         for tag in soup.select('script[type="application/ld+json"]'):
             try:
-                data = json.loads(tag.text)
+                data = _json.loads(tag.text or "null")
                 if isinstance(data, dict) and data.get("@type") in ("Person","Athlete"):
                     if "name" in data: jsonld_names.append(norm(data["name"]))
                 if isinstance(data, list):
@@ -445,9 +742,20 @@ def parse_sidearm_profile(html_text: str, page_url: str, input_name: str) -> Dic
     ))
     height_cm = feet_in_to_cm(meta_text) or feet_in_to_cm(soup.get_text(" "))
 
+    # One lazy sweep over the text nodes, remembering the first node for each label.
+    # Stop once the primary labels are seen; "pos"/"year" only matter when those are missing.
+    label_nodes: Dict[str, Any] = {}
+    for node in soup.descendants:
+        if not isinstance(node, NavigableString):
+            continue
+        for m in _LABEL_RE.finditer(node):
+            label_nodes.setdefault(m.group(1).lower(), node)
+        if _PRIMARY_LABELS.issubset(label_nodes):
+            break
+
     def find_label_value(labels: List[str]) -> Optional[str]:
         for lab in labels:
-            node = soup.find(string=re.compile(rf"\b{lab}\b", re.I))
+            node = label_nodes.get(lab)
             if node:
                 nxt = node.find_next()
                 if nxt:
@@ -455,13 +763,13 @@ def parse_sidearm_profile(html_text: str, page_url: str, input_name: str) -> Dic
         return None
 
     # Sidearm also encodes some attrs as labeled items with classes
-    position = find_label_value(["Position", "Pos.", "POS", "Position(s)"])
+    position = find_label_value(["position", "pos"])
     if not position:
         clspos = soup.select_one('[class*="position"]')
         if clspos: position = norm(clspos.get_text(" "))
 
-    class_year = find_label_value(["Class", "Year", "Academic Year"])
-    hometown = find_label_value(["Hometown"])
+    class_year = find_label_value(["class", "year"])
+    hometown = find_label_value(["hometown"])
 
     # --- Headshot: src, data-src, or srcset; prefer image in header/figure
     headshot = None
@@ -478,21 +786,20 @@ def parse_sidearm_profile(html_text: str, page_url: str, input_name: str) -> Dic
             break
 
     # --- Stats: accept any sidearm-like table with common soccer columns
-    common_cols = {"gp","g","a","pts","min","gs","sog","gw","sh","yc","rc"}
     stats: List[Dict[str, Any]] = []
-    for table in soup.select("table"):
+    for table in soup.select(_TABLE_SEL):
         # Get headers
-        headers = [norm(th.get_text(" ")) for th in table.select("thead th")]
+        headers = [norm(th.get_text(" ")) for th in table.select(_HDR_THEAD_SEL)]
         if not headers:
-            headers = [norm(th.get_text(" ")) for th in table.select("tr th")]
+            headers = [norm(th.get_text(" ")) for th in table.select(_HDR_ROW_SEL)]
         if not headers or len(headers) < 3:
             continue
         header_keys = {h.lower().strip(".") for h in headers}
         # Heuristic: treat as stats if there's overlap with common soccer stat columns
-        if len(header_keys.intersection(common_cols)) < 2 and not any(h in header_keys for h in ("season","year")):
+        if sum(1 for h in header_keys if h in _COMMON_COLS) < 2 and _SEASONISH.isdisjoint(header_keys):
             continue
-        for tr in table.select("tbody tr"):
-            tds = tr.select("td")
+        for tr in table.select(_ROW_SEL):
+            tds = tr.select(_CELL_SEL)
             if not tds: continue
             cells = [norm(td.get_text(" ")) for td in tds]
             row = dict(zip(headers[:len(cells)], cells))
@@ -534,70 +841,135 @@ def parse_sidearm_profile(html_text: str, page_url: str, input_name: str) -> Dic
 
 # ---------------- Orchestrator ----------------
 
-async def find_and_scrape(name: str, school: str, sport_path: str = SPORT_PATH) -> Dict[str, Any]:
+# Finished lookups are kept on disk so repeat queries skip the network entirely;
+# misses expire sooner in case the roster was simply not posted yet.
+RESULT_TTL = 6 * 3600
+NOT_FOUND_TTL = 30 * 60
+
+def _result_path(name: str, school: str, sport_path: str) -> str:
+    key = hashlib.sha1(f"{name}|{school}|{sport_path}".lower().encode()).hexdigest()
+    return os.path.join(CACHE_DIR, "players", key + ".json")
+
+def load_cached_result(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        return None
+    data = read_json(path)
+    if not isinstance(data, dict):
+        return None
+    return data if age < (RESULT_TTL if data.get("found") else NOT_FOUND_TTL) else None
+
+async def find_and_scrape(name: str, school: str, sport_path: str = SPORT_PATH, refresh: bool = False) -> Dict[str, Any]:
+    """Look up a player's profile, serving a recent on-disk result unless refresh is set."""
+    path = _result_path(name, school, sport_path)
+    if not refresh:
+        cached = load_cached_result(path)
+        if cached is not None:
+            return cached
+    data = await _find_and_scrape(name, school, sport_path)
+    # Fetch failures are transient: only remember a miss if the roster loaded, and
+    # only remember a hit if its stats didn't come back empty because of an outage
+    if data.get("found"):
+        if data.get("stats_source") != "unavailable":
+            write_json(path, data)
+    elif data.get("reason") == "profile_not_found":
+        write_json(path, data)
+    return data
+
+async def _find_and_scrape(name: str, school: str, sport_path: str) -> Dict[str, Any]:
     school_key = norm_key(school)
     domain = SCHOOL_TO_ATHLETICS.get(school_key)
     if not domain:
-        base = slugify(re.sub(r"\b(college|university)\b", "", school_key)).replace("-", "")
+        base = slugify(_SCHOOL_SUFFIX_RE.sub("", school_key)).replace("-", "")
         domain = f"athletics.{base}.edu"
 
-    async with httpx.AsyncClient(timeout=TIMEOUT, headers=DEFAULT_HEADERS, http2=True) as client:
-        url = await sidearm_find_profile(client, domain, name)
-        if not url:
-            url = await search_profile_by_web(name, domain)
-        if not url:
-            return {"found": False, "reason": "profile_not_found", "school_domain": domain, "input": {"name": name, "school": school}}
+    client = await get_client()
+    url, roster_loaded = await sidearm_find_profile(client, domain, name)
+    if not url:
+        url = await search_profile_by_web(name, domain)
+    if not url:
+        # Only a roster we could actually read is evidence the player isn't there
+        reason = "profile_not_found" if roster_loaded else "roster_unavailable"
+        return {"found": False, "reason": reason, "school_domain": domain, "input": {"name": name, "school": school}}
 
-        r = await fetch(client, url)
-        html_text = r.text
-        provider = guess_provider_from_html(html_text) or "unknown"
+    r = await fetch(client, url)
+    # The provider scan works on raw bytes; the soup decodes only when the charset requires it
+    provider = guess_provider_from_html(r.content) or "unknown"
+    soup = soup_of_response(r)
 
-        if provider == "sidearm":
-            data = parse_sidearm_profile(html_text, str(r.url), name)
-            
-            # Try to get stats from team stats page if no stats found
-            if not data.get("stats_rows"):
-                print(f"DEBUG: No stats found in profile, trying team stats page...")
-                team_stats = await fetch_player_stats_from_team_page(client, domain, name, sport_path)
-                if team_stats:
-                    print(f"DEBUG: Found {len(team_stats)} stats rows from team page")
-                    data["stats_rows"] = team_stats
-                    data["stats_source"] = "team_stats_page"
-                else:
-                    print(f"DEBUG: No stats found in team stats page either")
-        else:
-            soup = BeautifulSoup(html_text, "lxml")
-            inferred_name = best_match(
-                name,
-                [
-                    norm((soup.select_one("h1") or soup.title).get_text(" ")) if (soup.select_one("h1") or soup.title) else None,
-                    (soup.select_one('meta[property="og:title"]') or {}).get("content", None),
-                ],
-            )
-            data = {"url": str(r.url), "provider": provider, "name": inferred_name}
-
-        # Load accolades data and search for matches
-        accolades_data = load_accolades_data()
-        found_accolades = find_player_accolades(data.get("name", name), school, accolades_data)
-        data["accolades"] = found_accolades
-
-        data.update({
-            "found": True,
-            "input": {"name": name, "school": school, "sport_path": sport_path},
-            "school_domain": domain,
-        })
-        return data
+    if provider == "sidearm":
+        data = parse_sidearm_profile(soup, str(r.url), name)
+        
+        # Try to get stats from team stats page if no stats found
+        if not data.get("stats_rows"):
+            log.debug("No stats found in profile, trying team stats page...")
+            team_stats, stats_loaded = await fetch_player_stats_from_team_page(client, domain, name, sport_path)
+            if team_stats:
+                log.debug("Found %d stats rows from team page", len(team_stats))
+                data["stats_rows"] = team_stats
+                data["stats_source"] = "team_stats_page"
+            elif not stats_loaded:
+                log.debug("Team stats pages could not be fetched")
+                data["stats_source"] = "unavailable"
+            else:
+                log.debug("No stats found in team stats page either")
+    else:
+        inferred_name = best_match(
+            name,
+            [
+                norm((soup.select_one("h1") or soup.title).get_text(" ")) if (soup.select_one("h1") or soup.title) else None,
+                (soup.select_one('meta[property="og:title"]') or {}).get("content", None),
+            ],
+        )
+        data = {"url": str(r.url), "provider": provider, "name": inferred_name}
+
+    # Load accolades data and search for matches
+    accolades_data = load_accolades_data()
+    found_accolades = find_player_accolades(data.get("name", name), school, accolades_data)
+    data["accolades"] = found_accolades
+
+    data.update({
+        "found": True,
+        "input": {"name": name, "school": school, "sport_path": sport_path},
+        "school_domain": domain,
+    })
+    return data
 
 # ---------------- CLI ----------------
 
+# Counting columns summed into career totals, in output order
+STAT_COLS = ("gp", "gs", "g", "a", "pts", "sh", "sog", "gw", "min")
+
 if __name__ == "__main__":
     import sys
-    if len(sys.argv) < 3:
-        print("Usage: python scrape_player.py 'Player Name' 'School Name'")
+    flags = {a for a in sys.argv[1:] if a in ("--refresh", "--debug")}
+    args = [a for a in sys.argv[1:] if a not in flags]
+    refresh = "--refresh" in flags
+    if len(args) < 2:
+        print("Usage: python scrape_player.py 'Player Name' 'School Name' [--refresh] [--debug]")
         raise SystemExit(1)
-    name = sys.argv[1]
-    school = sys.argv[2]
-    result = asyncio.run(find_and_scrape(name, school))
+    if "--debug" in flags:
+        logging.basicConfig(format="%(levelname)s: %(message)s")
+        log.setLevel(logging.DEBUG)
+    name = args[0]
+    school = args[1]
+
+    async def main() -> Dict[str, Any]:
+        try:
+            return await find_and_scrape(name, school, refresh=refresh)
+        finally:
+            await close_client()
+
+    # Run on uvloop (>= 0.18) when available, without installing a global loop policy
+    run = asyncio.run
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            run = getattr(uvloop, "run", asyncio.run)
+        except ImportError:
+            pass
+    result = run(main())
     
     # Format output in the desired table format
     if result.get("found"):
@@ -619,40 +991,19 @@ if __name__ == "__main__":
             # Print header row
             print("Season\tGP\tGS\tG\tA\tPTS\tSH\tSH%\tSOG\tSOG%\tGW\tPK-ATT\tMIN")
             
-            # Deduplicate and organize by season
+            # Deduplicate and organize by season: (counting stats, sh%, sog%, pk-att)
             season_data = {}
             for row in stats_rows:
                 season = row.get("_season", "Unknown")
-                gp = int(row.get("gp", "0"))
-                gs = int(row.get("gs", "0"))
-                g = int(row.get("g", "0"))
-                a = int(row.get("a", "0"))
-                pts = int(row.get("pts", "0"))
-                sh = int(row.get("sh", "0"))
-                sog = int(row.get("sog", "0"))
-                gw = int(row.get("gw", "0"))
-                min_played = int(row.get("min", "0"))
+                vals = tuple(int(row.get(c) or 0) for c in STAT_COLS)
                 
                 # Keep the row with higher GP (overall stats vs conference stats)
-                if season not in season_data or gp > season_data[season]["gp"]:
-                    season_data[season] = {
-                        "gp": gp, "gs": gs, "g": g, "a": a, "pts": pts,
-                        "sh": sh, "sog": sog, "gw": gw, "min": min_played,
-                        "sh_pct": row.get("sh%", "0.000"),
-                        "sog_pct": row.get("sog%", "0.000"),
-                        "pk_att": row.get("pg-pa", "0-0")
-                    }
+                if season not in season_data or vals[0] > season_data[season][0][0]:
+                    season_data[season] = (vals, row.get("sh%", "0.000"), row.get("sog%", "0.000"), row.get("pg-pa", "0-0"))
             
-            # Calculate career totals
-            total_gp = sum(data["gp"] for data in season_data.values())
-            total_gs = sum(data["gs"] for data in season_data.values())
-            total_g = sum(data["g"] for data in season_data.values())
-            total_a = sum(data["a"] for data in season_data.values())
-            total_pts = sum(data["pts"] for data in season_data.values())
-            total_sh = sum(data["sh"] for data in season_data.values())
-            total_sog = sum(data["sog"] for data in season_data.values())
-            total_gw = sum(data["gw"] for data in season_data.values())
-            total_min = sum(data["min"] for data in season_data.values())
+            # Calculate career totals column-wise
+            totals = tuple(map(sum, zip(*(vals for vals, *_ in season_data.values()))))
+            total_gp, total_gs, total_g, total_a, total_pts, total_sh, total_sog, total_gw, total_min = totals
             
             # Calculate percentages
             total_sh_pct = f"{total_g/total_sh:.3f}" if total_sh > 0 else "0.000"
@@ -660,8 +1011,8 @@ if __name__ == "__main__":
             
             # Print season data in order
             for season in sorted(season_data.keys()):
-                data = season_data[season]
-                print(f"{season}\t{data['gp']}\t{data['gs']}\t{data['g']}\t{data['a']}\t{data['pts']}\t{data['sh']}\t{data['sh_pct']}\t{data['sog']}\t{data['sog_pct']}\t{data['gw']}\t{data['pk_att']}\t{data['min']}")
+                (gp, gs, g, a, pts, sh, sog, gw, min_played), sh_pct, sog_pct, pk_att = season_data[season]
+                print(f"{season}\t{gp}\t{gs}\t{g}\t{a}\t{pts}\t{sh}\t{sh_pct}\t{sog}\t{sog_pct}\t{gw}\t{pk_att}\t{min_played}")
             
             # Print career totals
             print(f"Total\t{total_gp}\t{total_gs}\t{total_g}\t{total_a}\t{total_pts}\t{total_sh}\t{total_sh_pct}\t{total_sog}\t{total_sog_pct}\t{total_gw}\t0-0\t{total_min}")
@@ -678,7 +1029,5 @@ if __name__ == "__main__":
             print("Accolades")
             print("No accolades found.")
     else:
-        print("No statistics available.")
-else:
-    print(f"Player not found: {result.get('reason', 'Unknown error')}")
-    print(json.dumps(result, indent=2, ensure_ascii=False))
\ No newline at end of file
+        print(f"Player not found: {result.get('reason', 'Unknown error')}")
+        print(json.dumps(result, indent=2, ensure_ascii=False))